@@ -64,7 +64,7 @@ def make_strings(orb_list, nelec):
                 res.append(n | thisorb)
         return res
     strings = gen_str_iter(orb_list, nelec)
-    assert (strings.__len__() == num_strings(len(orb_list),nelec))
+    assert (len(strings) == num_strings(len(orb_list),nelec))
     return numpy.asarray(strings, dtype=numpy.int64)
 gen_strings4orblist = make_strings
 
@@ -1257,7 +1257,9 @@ def dumps(mol):
     '''
     exclude_keys = {'output', 'stdout', '_keys', '_ctx_lock',
                     # Constructing in function loads
-                    'symm_orb', 'irrep_id', 'irrep_name'}
+                    'symm_orb', 'irrep_id', 'irrep_name',
+                    # Lazy caches derived from symm_orb (see scf.hf_symm)
+                    '_orbsym_default', '_irrep_sizes', '_irrep_maps'}
     moldic = dict(mol.__dict__)
     for k in exclude_keys:
         if k in moldic:
@@ -1910,7 +1912,7 @@ def same_mol(mol1, mol2, tol=1e-5, cmp_basis=True, ignore_chiral=False):
     '''
     from pyscf import symm
 
-    if mol1._atom.__len__() != mol2._atom.__len__():
+    if len(mol1._atom) != len(mol2._atom):
         return False
 
     chg1 = mol1._atm[:,CHARGE_OF]
@@ -2816,7 +2818,7 @@ class MoleBase(lib.StreamObject):
                 logger.info(self, "symmetry axis x: %s", self._symm_axes[0])
                 logger.info(self, "symmetry axis y: %s", self._symm_axes[1])
                 logger.info(self, "symmetry axis z: %s", self._symm_axes[2])
-                for ir in range(self.symm_orb.__len__()):
+                for ir in range(len(self.symm_orb)):
                     logger.info(self, 'num. orbitals of irrep %s = %d',
                                 self.irrep_name[ir], self.symm_orb[ir].shape[1])
             logger.info(self, 'number of shells = %d', self.nbas)
@@ -26,7 +26,6 @@ Function symm.label_orb_symm can be used to detect the symmetry of the
 molecular orbitals.
 '''
 
-from functools import reduce
 import numpy
 import scipy.linalg
 from pyscf import lib
@@ -41,6 +40,7 @@ from pyscf import __config__
 
 WITH_META_LOWDIN = getattr(__config__, 'scf_analyze_with_meta_lowdin', True)
 MO_BASE = getattr(__config__, 'MO_BASE', 1)
+EIG_WITH_THREADS = getattr(__config__, 'scf_hf_symm_eig_with_threads', False)
 
 
 # mo_energy, mo_coeff, mo_occ are all in nosymm representation
@@ -64,7 +64,7 @@ def analyze(mf, verbose=logger.DEBUG, with_meta_lowdin=WITH_META_LOWDIN,
         nirrep = len(mol.irrep_id)
         orbsym = mf.get_orbsym(mo_coeff, ovlp_ao)
         wfnsym = 0
-        noccs = [sum(orbsym[mo_occ>0]==ir) for ir in mol.irrep_id]
+        noccs = _irrep_count(mol.irrep_id, orbsym[mo_occ>0]).astype(int)
         if mol.groupname in symm.param.POINTGROUP:
             log.note('Wave-function symmetry = %s',
                      symm.irrep_id2name(mol.groupname, wfnsym))
@@ -74,9 +74,7 @@ def analyze(mf, verbose=logger.DEBUG, with_meta_lowdin=WITH_META_LOWDIN,
         log.note('occupancy for each irrep:  ' + (' %4s'*nirrep), *mol.irrep_name)
         log.note('                           ' + (' %4d'*nirrep), *noccs)
         log.note('**** MO energy ****')
-        irname_full = {}
-        for k,ir in enumerate(mol.irrep_id):
-            irname_full[ir] = mol.irrep_name[k]
+        irname_full = _irrep_maps(mol)[0]
         irorbcnt = {}
         for k, j in enumerate(orbsym):
             if j in irorbcnt:
@@ -101,7 +99,7 @@ def analyze(mf, verbose=logger.DEBUG, with_meta_lowdin=WITH_META_LOWDIN,
         if with_meta_lowdin:
             log.debug(' ** MO coefficients (expansion on meta-Lowdin AOs) **')
             orth_coeff = orth.orth_ao(mol, 'meta_lowdin', s=ovlp_ao)
-            c = reduce(numpy.dot, (orth_coeff.conj().T, ovlp_ao, mo_coeff))
+            c = numpy.linalg.multi_dot([orth_coeff.conj().T, ovlp_ao, mo_coeff])
         else:
             log.debug(' ** MO coefficients (expansion on AOs) **')
             c = mo_coeff
@@ -115,6 +113,39 @@ def analyze(mf, verbose=logger.DEBUG, with_meta_lowdin=WITH_META_LOWDIN,
     dip = mf.dip_moment(mol, dm, verbose=log)
     return pop_and_charge, dip
 
+def _irrep_maps(mol):
+    '''Memoized {irrep_id: irrep_name} and {irrep_name: irrep_id} mappings.
+    '''
+    cached = mol.__dict__.get('_irrep_maps')
+    if cached is None or cached[0] is not mol.irrep_name:
+        cached = (mol.irrep_name,
+                  dict(zip(mol.irrep_id, mol.irrep_name)),
+                  dict(zip(mol.irrep_name, mol.irrep_id)))
+        mol.__dict__['_irrep_maps'] = cached
+    return cached[1], cached[2]
+
+def _irrep_count(irrep_id, orbsym, weights=None):
+    '''Sum of weights (or number of orbitals if weights is None) in each
+    irrep, following the ordering of irrep_id.
+    '''
+    irrep_id = numpy.asarray(irrep_id)
+    order = numpy.argsort(irrep_id)
+    idx = order[numpy.searchsorted(irrep_id, orbsym, sorter=order)]
+    return numpy.bincount(idx, weights=weights, minlength=irrep_id.size)
+
+def _irrep_argsort(orbsym):
+    '''Permutation grouping orbital indices by irrep.  The indices of irrep
+    ir are perm[lo:hi] where lo, hi = numpy.searchsorted(labels, [ir, ir+1])
+    and perm, labels are the returned arrays.  The sort is stable, so the
+    indices of each irrep stay in ascending order, and it is skipped when
+    the labels are already grouped.
+    '''
+    orbsym = numpy.asarray(orbsym)
+    if orbsym.size == 0 or numpy.all(orbsym[:-1] <= orbsym[1:]):
+        return numpy.arange(orbsym.size), orbsym
+    perm = numpy.argsort(orbsym, kind='stable')
+    return perm, orbsym[perm]
+
 def get_irrep_nelec(mol, mo_coeff, mo_occ, s=None):
     '''Electron numbers for each irreducible representation.
 
@@ -140,8 +171,9 @@ def get_irrep_nelec(mol, mo_coeff, mo_occ, s=None):
     {'A1': 6, 'A2': 0, 'B1': 2, 'B2': 2}
     '''
     orbsym = get_orbsym(mol, mo_coeff, s, False)
-    irrep_nelec = {mol.irrep_name[k]: int(sum(mo_occ[orbsym==ir]))
-                        for k, ir in enumerate(mol.irrep_id)}
+    nelecs = _irrep_count(mol.irrep_id, orbsym, weights=mo_occ)
+    irrep_nelec = {mol.irrep_name[k]: int(nelecs[k])
+                   for k in range(len(mol.irrep_id))}
     return irrep_nelec
 
 def canonicalize(mf, mo_coeff, mo_occ, fock=None):
@@ -169,7 +201,7 @@ def canonicalize(mf, mo_coeff, mo_occ, fock=None):
                 idx = idx0 & idx1
                 if numpy.count_nonzero(idx) > 0:
                     orb = mo_coeff[:,idx]
-                    f1 = reduce(numpy.dot, (orb.conj().T, fock, orb))
+                    f1 = numpy.linalg.multi_dot([orb.conj().T, fock, orb])
                     e, c = scipy.linalg.eigh(f1)
                     mo[:,idx] = numpy.dot(mo_coeff[:,idx], c)
                     mo_e[idx] = e
@@ -178,7 +210,7 @@ def canonicalize(mf, mo_coeff, mo_occ, fock=None):
         for idx in (coreidx, openidx, viridx):
             if numpy.count_nonzero(idx) > 0:
                 orb = mo_coeff[:,idx]
-                f1 = reduce(numpy.dot, (orb.conj().T, fock, orb))
+                f1 = numpy.linalg.multi_dot([orb.conj().T, fock, orb])
                 e, c = scipy.linalg.eigh(f1)
                 c = numpy.dot(mo_coeff[:,idx], c)
                 mo[:,idx] = _symmetrize_canonicalization_(mf, e, c, s)
@@ -208,7 +240,7 @@ def _symmetrize_canonicalization_(mf, mo_energy, mo_coeff, s):
         for i,ir in enumerate(mol.irrep_id):
             so = mol.symm_orb[i]
             sosc = numpy.dot(so.conj().T, scsub)
-            s_ir = reduce(numpy.dot, (so.conj().T, s, so))
+            s_ir = numpy.linalg.multi_dot([so.conj().T, s, so])
             fock_ir = numpy.dot(sosc*esub, sosc.conj().T)
             mo_energy, u = mf._eigh(fock_ir, s_ir)
             idx = abs(mo_energy) > emin
@@ -223,8 +255,19 @@ def _symmetrize_canonicalization_(mf, mo_energy, mo_coeff, s):
 def so2ao_mo_coeff(so, irrep_mo_coeff):
     '''Transfer the basis of MO coefficients, from symmetry-adapted basis to AO basis
     '''
-    return numpy.hstack([numpy.dot(so[ir],irrep_mo_coeff[ir])
-                         for ir in range(so.__len__())])
+    nao = so[0].shape[0]
+    nmo = sum(c.shape[1] for c in irrep_mo_coeff)
+    out = numpy.empty((nao, nmo),
+                      dtype=numpy.result_type(so[0], irrep_mo_coeff[0]))
+    p0 = 0
+    for ir in range(len(so)):
+        p1 = p0 + irrep_mo_coeff[ir].shape[1]
+        # numpy.dot does not accept a non-contiguous out array; assigning
+        # the block product still saves the intermediate list and the
+        # second copy that hstack would make.
+        out[:,p0:p1] = numpy.dot(so[ir], irrep_mo_coeff[ir])
+        p0 = p1
+    return out
 
 def check_irrep_nelec(mol, irrep_nelec, nelec):
     for irname in irrep_nelec:
@@ -305,40 +348,101 @@ def eig(mf, h, s, symm_orb=None, irrep_id=None):
         symm_orb = mol.symm_orb
         irrep_id = mol.irrep_id
 
-    nirrep = symm_orb.__len__()
+    nirrep = len(symm_orb)
     h = symm.symmetrize_matrix(h, symm_orb)
-    s = symm.symmetrize_matrix(s, symm_orb)
-    cs = []
-    es = []
-    orbsym = []
+    # The SCF driver builds s1e once and passes the same array to every
+    # eig call, so the symmetrized overlap blocks of previous cycles can
+    # be reused.  A single slot, validated on the identity of both
+    # inputs, is kept and overwritten on miss, so rebuilding mol does
+    # not accumulate blocks of stale geometries.
+    cached = mf.__dict__.get('_symm_ovlp_cache')
+    if cached is not None and cached[0] is s and cached[1] is symm_orb:
+        s = cached[2]
+    else:
+        s_blocks = symm.symmetrize_matrix(s, symm_orb)
+        mf.__dict__['_symm_ovlp_cache'] = (s, symm_orb, s_blocks)
+        s = s_blocks
+    nao = symm_orb[0].shape[0]
+    offsets = numpy.append(0, numpy.cumsum(_irrep_sizes(mol, symm_orb)))
+    nmo = offsets[-1]
+    # Eigenvectors of each block are transformed to AO basis and written
+    # directly into the output arrays, without collecting per-irrep lists
+    # and paying an extra hstack copy.
+    e = numpy.empty(nmo)
+    c = numpy.empty((nao, nmo), dtype=numpy.result_type(h[0], s[0], symm_orb[0]))
+    orbsym = numpy.empty(nmo, dtype=int)
     if getattr(mol, 'groupname', None) in ('Dooh', 'Coov'):
-        for ir in range(nirrep):
-            irrep_1d = irrep_id[ir] in (0, 1, 4, 5)
-            irrep_2dx = irrep_id[ir] % 2 == 0
-            if irrep_1d or irrep_2dx:
-                e, c = mf._eigh(h[ir], s[ir])
-                cs.append(c)
-                es.append(e)
-                orbsym.append([irrep_id[ir]] * e.size)
-
-            if not irrep_1d and irrep_2dx:
+        # The y component of a 2D irrep reuses the eigenvectors of its x
+        # component, so only the 1D irreps and the x components are solved.
+        solve_ids = [ir for ir in range(nirrep)
+                     if irrep_id[ir] in (0, 1, 4, 5) or irrep_id[ir] % 2 == 0]
+        for ir, (e_ir, c_ir) in zip(solve_ids, _solve_blocks(mf, h, s, solve_ids)):
+            p0, p1 = offsets[ir], offsets[ir+1]
+            e[p0:p1] = e_ir
+            c[:,p0:p1] = numpy.dot(symm_orb[ir], c_ir)
+            orbsym[p0:p1] = irrep_id[ir]
+
+            if irrep_id[ir] not in (0, 1, 4, 5):
                 # force 2D irreps using the same coefficients
                 irrep_conj = irrep_id[ir] ^ 1
                 assert irrep_id[ir+1] == irrep_conj
-                cs.append(c)
-                es.append(e)
-                orbsym.append([irrep_conj] * e.size)
+                e[p1:offsets[ir+2]] = e_ir
+                c[:,p1:offsets[ir+2]] = numpy.dot(symm_orb[ir+1], c_ir)
+                orbsym[p1:offsets[ir+2]] = irrep_conj
     else:
-        for ir in range(nirrep):
-            e, c = mf._eigh(h[ir], s[ir])
-            cs.append(c)
-            es.append(e)
-            orbsym.append([irrep_id[ir]] * e.size)
-    e = numpy.hstack(es)
-    c = so2ao_mo_coeff(symm_orb, cs)
-    c = lib.tag_array(c, orbsym=numpy.hstack(orbsym))
+        blocks = _solve_blocks(mf, h, s, range(nirrep))
+        for ir, (e_ir, c_ir) in enumerate(blocks):
+            p0, p1 = offsets[ir], offsets[ir+1]
+            e[p0:p1] = e_ir
+            c[:,p0:p1] = numpy.dot(symm_orb[ir], c_ir)
+            orbsym[p0:p1] = irrep_id[ir]
+    c = lib.tag_array(c, orbsym=orbsym)
     return e, c
 
+def _solve_blocks(mf, h, s, block_ids):
+    '''Diagonalize the listed irrep blocks, in a thread pool if configured.
+
+    The blocks are independent and LAPACK releases the GIL, so threads can
+    diagonalize the many small blocks of a high-symmetry molecule
+    concurrently.  Disabled by default since the BLAS library may already
+    use all cores for each diagonalization.
+    '''
+    block_ids = list(block_ids)
+    if EIG_WITH_THREADS and len(block_ids) > 1 and lib.num_threads() > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        nworkers = min(len(block_ids), lib.num_threads())
+        with ThreadPoolExecutor(max_workers=nworkers) as ex:
+            return list(ex.map(lambda ir: mf._eigh(h[ir], s[ir]), block_ids))
+    return [mf._eigh(h[ir], s[ir]) for ir in block_ids]
+
+def _irrep_sizes(mol, symm_orb=None):
+    '''Number of symmetry-adapted functions in each irrep, memoized on mol
+    since symm_orb does not change between SCF iterations.
+    '''
+    if symm_orb is None:
+        symm_orb = mol.symm_orb
+    cached = mol.__dict__.get('_irrep_sizes')
+    if cached is None or cached[0] is not symm_orb:
+        cached = (symm_orb, numpy.array([c.shape[1] for c in symm_orb]))
+        mol.__dict__['_irrep_sizes'] = cached
+    return cached[1]
+
+def _default_orbsym(mol, symm_orb=None, irrep_id=None):
+    '''Irrep labels of orbitals grouped by irreps (the ordering produced by
+    function eig).  The labels are memoized on mol since symm_orb does not
+    change between SCF iterations.
+    '''
+    if symm_orb is None or irrep_id is None:
+        symm_orb = mol.symm_orb
+        irrep_id = mol.irrep_id
+    cached = mol.__dict__.get('_orbsym_default')
+    if cached is None or cached[0] is not symm_orb:
+        orbsym = numpy.repeat(numpy.asarray(irrep_id),
+                              _irrep_sizes(mol, symm_orb))
+        cached = (symm_orb, orbsym)
+        mol.__dict__['_orbsym_default'] = cached
+    return cached[1]
+
 def get_orbsym(mol, mo_coeff, s=None, check=False, symm_orb=None, irrep_id=None):
     if getattr(mo_coeff, 'orbsym', None) is not None:
         return mo_coeff.orbsym
@@ -347,8 +451,7 @@ def get_orbsym(mol, mo_coeff, s=None, check=False, symm_orb=None, irrep_id=None)
         symm_orb = mol.symm_orb
         irrep_id = mol.irrep_id
     if mo_coeff is None:
-        orbsym = numpy.hstack([[ir] * symm_orb[i].shape[1]
-                               for i, ir in enumerate(irrep_id)])
+        orbsym = _default_orbsym(mol, symm_orb, irrep_id)
     else:
         orbsym = symm.label_orb_symm(mol, irrep_id, symm_orb,
                                      mo_coeff, s, check)
@@ -473,13 +576,21 @@ class SymAdaptedRHF(hf.RHF):
         mo_occ = numpy.zeros_like(mo_energy)
         rest_idx = numpy.ones(mo_occ.size, dtype=bool)
         nelec_fix = 0
-        for i, ir in enumerate(mol.irrep_id):
-            irname = mol.irrep_name[i]
-            if irname in self.irrep_nelec:
-                ir_idx = numpy.where(orbsym == ir)[0]
-                n = self.irrep_nelec[irname]
-                occ_sort = numpy.argsort(mo_energy[ir_idx].round(9), kind='stable')
-                occ_idx  = ir_idx[occ_sort[:n//2]]
+        if self.irrep_nelec:
+            id_by_name = _irrep_maps(mol)[1]
+            perm, sym_sorted = _irrep_argsort(orbsym)
+            for irname, n in self.irrep_nelec.items():
+                ir = id_by_name[irname]
+                lo, hi = numpy.searchsorted(sym_sorted, [ir, ir+1])
+                ir_idx = perm[lo:hi]
+                # Selecting the n//2 lowest orbitals does not require a full
+                # sort; their internal ordering does not affect mo_occ.
+                nocc = n // 2
+                if 0 < nocc < ir_idx.size:
+                    occ_part = numpy.argpartition(mo_energy[ir_idx].round(9), nocc)
+                    occ_idx = ir_idx[occ_part[:nocc]]
+                else:
+                    occ_idx = ir_idx[:nocc]
                 mo_occ[occ_idx] = 2
                 nelec_fix += n
                 rest_idx[ir_idx] = False
@@ -487,28 +598,31 @@ class SymAdaptedRHF(hf.RHF):
         assert (nelec_float >= 0)
         if nelec_float > 0:
             rest_idx = numpy.where(rest_idx)[0]
-            occ_sort = numpy.argsort(mo_energy[rest_idx].round(9), kind='stable')
-            occ_idx  = rest_idx[occ_sort[:nelec_float//2]]
+            nocc = nelec_float // 2
+            if 0 < nocc < rest_idx.size:
+                occ_part = numpy.argpartition(mo_energy[rest_idx].round(9), nocc)
+                occ_idx = rest_idx[occ_part[:nocc]]
+            else:
+                occ_idx = rest_idx[:nocc]
             mo_occ[occ_idx] = 2
 
         vir_idx = (mo_occ==0)
         if self.verbose >= logger.INFO and numpy.count_nonzero(vir_idx) > 0:
-            ehomo = max(mo_energy[~vir_idx])
-            elumo = min(mo_energy[ vir_idx])
-            noccs = []
-            for i, ir in enumerate(mol.irrep_id):
-                irname = mol.irrep_name[i]
-                ir_idx = (orbsym == ir)
-
-                noccs.append(int(mo_occ[ir_idx].sum()))
-                if ehomo in mo_energy[ir_idx]:
-                    irhomo = irname
-                if elumo in mo_energy[ir_idx]:
-                    irlumo = irname
+            # Locate HOMO/LUMO with argmax/argmin, then read their irreps
+            # off orbsym instead of testing each irrep for membership.
+            irname_map = _irrep_maps(mol)[0]
+            occ_pos = numpy.where(~vir_idx)[0]
+            vir_pos = numpy.where(vir_idx)[0]
+            homo = occ_pos[mo_energy[occ_pos].argmax()]
+            lumo = vir_pos[mo_energy[vir_pos].argmin()]
+            ehomo = mo_energy[homo]
+            elumo = mo_energy[lumo]
             logger.info(self, 'HOMO (%s) = %.15g  LUMO (%s) = %.15g',
-                        irhomo, ehomo, irlumo, elumo)
+                        irname_map[orbsym[homo]], ehomo,
+                        irname_map[orbsym[lumo]], elumo)
 
-            logger.debug(self, 'irrep_nelec = %s', noccs)
+            noccs = _irrep_count(mol.irrep_id, orbsym, weights=mo_occ)
+            logger.debug(self, 'irrep_nelec = %s', noccs.astype(int).tolist())
             _dump_mo_energy(mol, mo_energy, mo_occ, ehomo, elumo, orbsym,
                             verbose=self.verbose)
         return mo_occ
@@ -517,13 +631,12 @@ class SymAdaptedRHF(hf.RHF):
         hf.RHF._finalize(self)
 
         # sort MOs wrt orbital energies, it should be done last.
-        # Using mergesort because it is stable. We don't want to change the
-        # ordering of the symmetry labels when two orbitals are degenerated.
-        o_sort = numpy.argsort(self.mo_energy[self.mo_occ> 0].round(9), kind='stable')
-        v_sort = numpy.argsort(self.mo_energy[self.mo_occ==0].round(9), kind='stable')
-        idx = numpy.arange(self.mo_energy.size)
-        idx = numpy.hstack((idx[self.mo_occ> 0][o_sort],
-                            idx[self.mo_occ==0][v_sort]))
+        # lexsort is stable. We don't want to change the ordering of the
+        # symmetry labels when two orbitals are degenerated.  Sorting on
+        # -mo_occ as the primary key puts the occupied orbitals first and
+        # orders each occupancy group by energy in a single pass, without
+        # the mask copies of per-group argsorts.
+        idx = numpy.lexsort((self.mo_energy.round(9), -self.mo_occ))
         self.mo_energy = self.mo_energy[idx]
         self.mo_occ = self.mo_occ[idx]
         orbsym = self.get_orbsym(self.mo_coeff)
@@ -565,7 +678,14 @@ class SymAdaptedRHF(hf.RHF):
             return mo_coeff.orbsym
         if s is None:
             s = self.get_ovlp()
-        return numpy.asarray(get_orbsym(self.mol, mo_coeff, s))
+        orbsym = numpy.asarray(get_orbsym(self.mol, mo_coeff, s))
+        if mo_coeff is not None and mo_coeff is self.mo_coeff:
+            # Attach the labels to the stored orbitals so the following
+            # calls (get_occ, get_grad, _finalize ...) do not redo the
+            # symmetry projection.  Orbitals produced by self.eig carry
+            # this tag from the start.
+            self.mo_coeff = lib.tag_array(mo_coeff, orbsym=orbsym)
+        return orbsym
     orbsym = property(get_orbsym)
 
     get_wfnsym = get_wfnsym
@@ -642,8 +762,10 @@ class SymAdaptedROHF(rohf.ROHF):
     def eig(self, fock, s):
         e, c = eig(self, fock, s)
         if getattr(fock, 'focka', None) is not None:
-            mo_ea = numpy.einsum('pi,pi->i', c, fock.focka.dot(c))
-            mo_eb = numpy.einsum('pi,pi->i', c, fock.fockb.dot(c))
+            # (c * Fc).sum(0) dispatches to BLAS gemm + vectorized reduction,
+            # avoiding the einsum dispatch overhead on this per-cycle path
+            mo_ea = (c * fock.focka.dot(c)).sum(axis=0)
+            mo_eb = (c * fock.fockb.dot(c)).sum(axis=0)
             e = lib.tag_array(e, mo_ea=mo_ea, mo_eb=mo_eb)
         return e, c
 
@@ -680,15 +802,18 @@ class SymAdaptedROHF(rohf.ROHF):
         rest_idx = numpy.ones(mo_occ.size, dtype=bool)
         neleca_fix = 0
         nelecb_fix = 0
-        for i, ir in enumerate(mol.irrep_id):
-            irname = mol.irrep_name[i]
-            if irname in self.irrep_nelec:
-                ir_idx = numpy.where(orbsym == ir)[0]
-                if isinstance(self.irrep_nelec[irname], (int, numpy.integer)):
-                    nelecb = self.irrep_nelec[irname] // 2
-                    neleca = self.irrep_nelec[irname] - nelecb
+        if self.irrep_nelec:
+            id_by_name = _irrep_maps(mol)[1]
+            perm, sym_sorted = _irrep_argsort(orbsym)
+            for irname, irrep_ne in self.irrep_nelec.items():
+                ir = id_by_name[irname]
+                lo, hi = numpy.searchsorted(sym_sorted, [ir, ir+1])
+                ir_idx = perm[lo:hi]
+                if isinstance(irrep_ne, (int, numpy.integer)):
+                    nelecb = irrep_ne // 2
+                    neleca = irrep_ne - nelecb
                 else:
-                    neleca, nelecb = self.irrep_nelec[irname]
+                    neleca, nelecb = irrep_ne
                 if neleca > nelecb:
                     ncore, nopen = nelecb, neleca - nelecb
                 else:
@@ -714,27 +839,25 @@ class SymAdaptedROHF(rohf.ROHF):
         nopen = nocc - ncore
         vir_idx = (mo_occ==0)
         if self.verbose >= logger.INFO and nocc < nmo and ncore > 0:
-            ehomo = max(mo_energy[~vir_idx])
-            elumo = min(mo_energy[ vir_idx])
-            ndoccs = []
-            nsoccs = []
-            for i, ir in enumerate(mol.irrep_id):
-                irname = mol.irrep_name[i]
-                ir_idx = (orbsym == ir)
-
-                ndoccs.append(numpy.count_nonzero(mo_occ[ir_idx]==2))
-                nsoccs.append(numpy.count_nonzero(mo_occ[ir_idx]==1))
-                if ehomo in mo_energy[ir_idx]:
-                    irhomo = irname
-                if elumo in mo_energy[ir_idx]:
-                    irlumo = irname
+            # Locate HOMO/LUMO with argmax/argmin, then read their irreps
+            # off orbsym instead of testing each irrep for membership.
+            irname_map = _irrep_maps(mol)[0]
+            occ_pos = numpy.where(~vir_idx)[0]
+            vir_pos = numpy.where(vir_idx)[0]
+            homo = occ_pos[mo_energy[occ_pos].argmax()]
+            lumo = vir_pos[mo_energy[vir_pos].argmin()]
+            ehomo = mo_energy[homo]
+            elumo = mo_energy[lumo]
+            ndoccs = _irrep_count(mol.irrep_id, orbsym[mo_occ==2]).astype(int).tolist()
+            nsoccs = _irrep_count(mol.irrep_id, orbsym[mo_occ==1]).astype(int).tolist()
 
             # to help self.eigh compute orbital energy
             self._irrep_doccs = ndoccs
             self._irrep_soccs = nsoccs
 
             logger.info(self, 'HOMO (%s) = %.15g  LUMO (%s) = %.15g',
-                        irhomo, ehomo, irlumo, elumo)
+                        irname_map[orbsym[homo]], ehomo,
+                        irname_map[orbsym[lumo]], elumo)
 
             logger.debug(self, 'double occ irrep_nelec = %s', ndoccs)
             logger.debug(self, 'single occ irrep_nelec = %s', nsoccs)
@@ -769,23 +892,20 @@ class SymAdaptedROHF(rohf.ROHF):
             mo_occ = self.mo_occ
         mo_a = mo_coeff[:,mo_occ>0]
         mo_b = mo_coeff[:,mo_occ==2]
-        dm_a = numpy.dot(mo_a, mo_a.conj().T)
-        dm_b = numpy.dot(mo_b, mo_b.conj().T)
+        dm_a = _occ_mo_density(mo_a)
+        dm_b = _occ_mo_density(mo_b)
         return lib.tag_array((dm_a, dm_b), mo_coeff=mo_coeff, mo_occ=mo_occ)
 
     def _finalize(self):
         rohf.ROHF._finalize(self)
 
         # sort MOs wrt orbital energies, it should be done last.
-        # Using mergesort because it is stable. We don't want to change the
-        # ordering of the symmetry labels when two orbitals are degenerated.
-        c_sort = numpy.argsort(self.mo_energy[self.mo_occ==2].round(9), kind='stable')
-        o_sort = numpy.argsort(self.mo_energy[self.mo_occ==1].round(9), kind='stable')
-        v_sort = numpy.argsort(self.mo_energy[self.mo_occ==0].round(9), kind='stable')
-        idx = numpy.arange(self.mo_energy.size)
-        idx = numpy.hstack((idx[self.mo_occ==2][c_sort],
-                            idx[self.mo_occ==1][o_sort],
-                            idx[self.mo_occ==0][v_sort]))
+        # lexsort is stable. We don't want to change the ordering of the
+        # symmetry labels when two orbitals are degenerated.  Sorting on
+        # -mo_occ as the primary key orders the doubly occupied, singly
+        # occupied and virtual groups by energy in a single pass, without
+        # the mask copies of per-group argsorts.
+        idx = numpy.lexsort((self.mo_energy.round(9), -self.mo_occ))
         if getattr(self.mo_energy, 'mo_ea', None) is not None:
             mo_ea = self.mo_energy.mo_ea[idx]
             mo_eb = self.mo_energy.mo_eb[idx]
@@ -827,10 +947,9 @@ class SymAdaptedROHF(rohf.ROHF):
             self.dump_scf_summary(log)
 
             nirrep = len(mol.irrep_id)
-            orbsym = self.get_orbsym(mo_coeff)
-            irreps = numpy.asarray(mol.irrep_id)
-            ndoccs = numpy.count_nonzero(irreps[:,None] == orbsym[mo_occ==2], axis=1)
-            nsoccs = numpy.count_nonzero(irreps[:,None] == orbsym[mo_occ==1], axis=1)
+            orbsym = self.get_orbsym(mo_coeff, ovlp_ao)
+            ndoccs = _irrep_count(mol.irrep_id, orbsym[mo_occ==2]).astype(int)
+            nsoccs = _irrep_count(mol.irrep_id, orbsym[mo_occ==1]).astype(int)
 
             wfnsym = 0
             # wfn symmetry is determined by the odd number of electrons in each irrep
@@ -849,9 +968,7 @@ class SymAdaptedROHF(rohf.ROHF):
             log.note('double occ                 ' + (' %4d'*nirrep), *ndoccs)
             log.note('single occ                 ' + (' %4d'*nirrep), *nsoccs)
             log.note('**** MO energy ****')
-            irname_full = {}
-            for k,ir in enumerate(mol.irrep_id):
-                irname_full[ir] = mol.irrep_name[k]
+            irname_full = _irrep_maps(mol)[0]
             irorbcnt = {}
             if getattr(mo_energy, 'mo_ea', None) is not None:
                 mo_ea = mo_energy.mo_ea
@@ -889,7 +1006,7 @@ class SymAdaptedROHF(rohf.ROHF):
             if with_meta_lowdin:
                 log.debug(' ** MO coefficients (expansion on meta-Lowdin AOs) **')
                 orth_coeff = orth.orth_ao(mol, 'meta_lowdin', s=ovlp_ao)
-                c = reduce(numpy.dot, (orth_coeff.conj().T, ovlp_ao, mo_coeff))
+                c = numpy.linalg.multi_dot([orth_coeff.conj().T, ovlp_ao, mo_coeff])
             else:
                 log.debug(' ** MO coefficients (expansion on AOs) **')
                 c = mo_coeff
@@ -922,8 +1039,8 @@ class SymAdaptedROHF(rohf.ROHF):
         if getattr(fock, 'focka', None) is None:
             fock = self.get_fock(dm=self.make_rdm1(mo_coeff, mo_occ))
         mo_e, mo_coeff = canonicalize(self, mo_coeff, mo_occ, fock)
-        mo_ea = numpy.einsum('pi,pi->i', mo_coeff, fock.focka.dot(mo_coeff))
-        mo_eb = numpy.einsum('pi,pi->i', mo_coeff, fock.fockb.dot(mo_coeff))
+        mo_ea = (mo_coeff * fock.focka.dot(mo_coeff)).sum(axis=0)
+        mo_eb = (mo_coeff * fock.fockb.dot(mo_coeff)).sum(axis=0)
         mo_e = lib.tag_array(mo_e, mo_ea=mo_ea, mo_eb=mo_eb)
         return mo_e, mo_coeff
 
@@ -938,15 +1055,32 @@ class SymAdaptedROHF(rohf.ROHF):
 ROHF = SymAdaptedROHF
 
 
+def _occ_mo_density(mo):
+    '''mo . mo^H evaluated as a symmetric rank-k update, which costs half
+    the FLOPs of a general matrix product.
+    '''
+    if mo.dtype == numpy.double:
+        dm = scipy.linalg.blas.dsyrk(1., mo)
+        return lib.hermi_triu(dm)
+    else:
+        return numpy.dot(mo, mo.conj().T)
+
 def _dump_mo_energy(mol, mo_energy, mo_occ, ehomo, elumo, orbsym, title='',
                     verbose=logger.DEBUG):
     log = logger.new_logger(mol, verbose)
+    # Group the orbitals by irrep with one stable sort instead of scanning
+    # orbsym once per irrep.
+    order = numpy.argsort(orbsym, kind='stable')
+    orbsym_sorted = orbsym[order]
+    mo_energy_sorted = mo_energy[order]
+    mo_occ_sorted = mo_occ[order]
+    lbound = numpy.searchsorted(orbsym_sorted, mol.irrep_id, side='left')
+    ubound = numpy.searchsorted(orbsym_sorted, mol.irrep_id, side='right')
     for i, ir in enumerate(mol.irrep_id):
         irname = mol.irrep_name[i]
-        ir_idx = (orbsym == ir)
-        nso = numpy.count_nonzero(ir_idx)
-        nocc = numpy.count_nonzero(mo_occ[ir_idx])
-        e_ir = mo_energy[ir_idx]
+        nso = ubound[i] - lbound[i]
+        e_ir = mo_energy_sorted[lbound[i]:ubound[i]]
+        nocc = numpy.count_nonzero(mo_occ_sorted[lbound[i]:ubound[i]])
         if nocc == 0:
             log.debug('%s%s nocc = 0', title, irname)
         elif nocc == nso:
@@ -35,21 +35,24 @@ MO_BASE = getattr(__config__, 'MO_BASE', 1)
 
 def init_guess_by_minao(mol):
     dm = hf.init_guess_by_minao(mol)
-    dm = numpy.array((dm*.5, dm*.5))
+    dma = dm*.5
+    dm = numpy.stack((dma, dma))
     if hasattr(dm, 'mo_coeff'):
         dm = lib.tag_array(dm, mo_coeff=dm.mo_coeff, mo_occ=dm.mo_occ)
     return dm
 
 def init_guess_by_atom(mol):
     dm = hf.init_guess_by_atom(mol)
-    dm = numpy.array((dm*.5, dm*.5))
+    dma = dm*.5
+    dm = numpy.stack((dma, dma))
     if hasattr(dm, 'mo_coeff'):
         dm = lib.tag_array(dm, mo_coeff=dm.mo_coeff, mo_occ=dm.mo_occ)
     return dm
 
 def init_guess_by_sap(mol, sap_basis, **kwargs):
     dm = hf.init_guess_by_sap(mol, sap_basis, **kwargs)
-    dm = numpy.array((dm*.5, dm*.5))
+    dma = dm*.5
+    dm = numpy.stack((dma, dma))
     if hasattr(dm, 'mo_coeff'):
         dm = lib.tag_array(dm, mo_coeff=dm.mo_coeff, mo_occ=dm.mo_occ)
     return dm
@@ -90,7 +93,9 @@ def get_fock(mf, h1e=None, s1e=None, vhf=None, dm=None, cycle=-1, diis=None,
     if vhf is None: vhf = mf.get_veff(mf.mol, dm)
     if dm is None: dm = mf.make_rdm1()
     if isinstance(dm, numpy.ndarray) and dm.ndim == 2:
-        dm = numpy.array((dm*.5, dm*.5))
+        # Read-only view; the half density is only read below.
+        dma = dm*.5
+        dm = numpy.broadcast_to(dma, (2,) + dma.shape)
 # To Get orbital energy in get_occ, we saved alpha and beta fock, because
 # Roothaan effective Fock cannot provide correct orbital energy with `eig`
 # TODO, check other treatment  J. Chem. Phys. 133, 141102
@@ -141,13 +146,20 @@ def get_roothaan_fock(focka_fockb, dma_dmb, s):
 # Projector for core, open-shell, and virtual
     pc = numpy.dot(dmb, s)
     po = numpy.dot(dma-dmb, s)
-    pv = numpy.eye(nao) - numpy.dot(dma, s)
-    fock  = reduce(numpy.dot, (pc.conj().T, fc, pc)) * .5
-    fock += reduce(numpy.dot, (po.conj().T, fc, po)) * .5
-    fock += reduce(numpy.dot, (pv.conj().T, fc, pv)) * .5
-    fock += reduce(numpy.dot, (po.conj().T, fockb, pc))
-    fock += reduce(numpy.dot, (po.conj().T, focka, pv))
-    fock += reduce(numpy.dot, (pv.conj().T, fc, pc))
+    # pv = 1 - dma.s, without materializing an identity matrix
+    pv = numpy.dot(dma, s)
+    pv *= -1
+    pv[numpy.diag_indices(nao)] += 1
+    # Explicit two-step products; fc.pc feeds both the closed-closed and
+    # the virtual-closed blocks, saving one nao**3 GEMM per Fock build
+    # and the reduce dispatch of the triple products.
+    fcpc = numpy.dot(fc, pc)
+    fock  = numpy.dot(pc.conj().T, fcpc) * .5
+    fock += numpy.dot(po.conj().T, numpy.dot(fc, po)) * .5
+    fock += numpy.dot(pv.conj().T, numpy.dot(fc, pv)) * .5
+    fock += numpy.dot(po.conj().T, numpy.dot(fockb, pc))
+    fock += numpy.dot(po.conj().T, numpy.dot(focka, pv))
+    fock += numpy.dot(pv.conj().T, fcpc)
     fock = fock + fock.conj().T
     fock = lib.tag_array(fock, focka=focka, fockb=fockb)
     return fock
@@ -217,15 +229,19 @@ def get_occ(mf, mo_energy=None, mo_coeff=None):
 
 def _fill_rohf_occ(mo_energy, mo_energy_a, mo_energy_b, ncore, nopen):
     mo_occ = numpy.zeros_like(mo_energy)
-    open_idx = []
-    core_sort = numpy.argsort(mo_energy)
-    core_idx = core_sort[:ncore]
+    # Only the membership of the core and open shells matters, not their
+    # internal ordering, so an O(n) partition replaces the full argsort.
+    if 0 < ncore < mo_energy.size:
+        core_sort = numpy.argpartition(mo_energy, ncore)
+    else:
+        core_sort = numpy.arange(mo_energy.size)
+    mo_occ[core_sort[:ncore]] = 2
     if nopen > 0:
         open_idx = core_sort[ncore:]
-        open_sort = numpy.argsort(mo_energy_a[open_idx])
-        open_idx = open_idx[open_sort[:nopen]]
-    mo_occ[core_idx] = 2
-    mo_occ[open_idx] = 1
+        if nopen < open_idx.size:
+            open_part = numpy.argpartition(mo_energy_a[open_idx], nopen)
+            open_idx = open_idx[open_part[:nopen]]
+        mo_occ[open_idx] = 1
     return mo_occ
 
 def get_grad(mo_coeff, mo_occ, fock):
@@ -271,7 +287,8 @@ def make_rdm1(mo_coeff, mo_occ, **kwargs):
 def energy_elec(mf, dm=None, h1e=None, vhf=None):
     if dm is None: dm = mf.make_rdm1()
     elif isinstance(dm, numpy.ndarray) and dm.ndim == 2:
-        dm = numpy.array((dm*.5, dm*.5))
+        dma = dm*.5
+        dm = numpy.stack((dma, dma))
     return uhf.energy_elec(mf, dm, h1e, vhf)
 
 get_veff = uhf.get_veff
@@ -475,7 +492,8 @@ This is the Gaussian fit version as described in doi:10.1063/5.0004046.''')
         if mol is None: mol = self.mol
         if dm is None: dm = self.make_rdm1()
         if isinstance(dm, numpy.ndarray) and dm.ndim == 2:
-            dm = numpy.array((dm*.5, dm*.5))
+            dma = dm*.5
+            dm = numpy.stack((dma, dma))
 
         if self._eri is not None or not self.direct_scf:
             if hasattr(dm, 'mo_occ') and numpy.ndim(dm.mo_occ) == 1:
@@ -331,7 +331,7 @@ class SymAdaptedUHF(uhf.UHF):
 
     def eig(self, h, s):
         mol = self.mol
-        nirrep = mol.symm_orb.__len__()
+        nirrep = len(mol.symm_orb)
         s = symm.symmetrize_matrix(s, mol.symm_orb)
         ha = symm.symmetrize_matrix(h[0], mol.symm_orb)
         hb = symm.symmetrize_matrix(h[1], mol.symm_orb)
@@ -75,7 +75,7 @@ def symm_adapted_basis(mol, gpname, orig=0, coordinates=None):
 
     ops = numpy.asarray([param.D2H_OPS[op] for op in param.OPERATOR_TABLE[gpname]])
     chartab = numpy.array([x[1:] for x in param.CHARACTER_TABLE[gpname]])
-    nirrep = chartab.__len__()
+    nirrep = len(chartab)
     aoslice = mol.aoslice_by_atom()
     nao = mol.nao_nr()
     atom_coords = numpy.array([a[1] for a in prop_atoms])
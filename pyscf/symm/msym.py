@@ -72,7 +72,7 @@ def log_symmetry_info(mol):
     else:
         logger.info(mol, 'point group symmetry = %s, use subgroup %s',
                     mol.topgroup, mol.groupname)
-    for ir in range(mol.symm_orb.__len__()):
+    for ir in range(len(mol.symm_orb)):
         logger.info(mol, 'num. orbitals of irrep %s = %d',
                     mol.irrep_name[ir], mol.symm_orb[ir].shape[1])
 